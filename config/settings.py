@@ -113,6 +113,28 @@ DATABASES = {
 # }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+REDIS_URL = config("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    # Cached wallet lists are keyed by their list version, so a per-process cache
+    # never serves an entry older than the latest write; each worker just warms its own
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,58 @@
+from functools import lru_cache, wraps
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import HttpResponse
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+from core.renderers import render_json, json_response
+
+@lru_cache(maxsize=256)
+def _error_response_bytes(message) -> bytes:
+    return render_json({'success': False, 'message': message})
+
+def _error_response(message) -> HttpResponse:
+    """
+    Build the standard 400 response. Plain string messages, and lists of them,
+    reuse cached bytes so repeated failures skip encoding entirely.
+    Args:
+        message: The error message, as raised (str, list or dict).
+    Returns:
+        HttpResponse: The {'success': False, 'message': ...} 400 response.
+    """
+    if isinstance(message, list) and all(isinstance(item, str) for item in message):
+        message = tuple(message)
+    if isinstance(message, (str, tuple)):
+        return HttpResponse(
+            _error_response_bytes(message),
+            content_type='application/json',
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return json_response(
+        {
+            'success': False,
+            'message': message
+        },
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+def api_error_handler(view_method):
+    """
+    Decorator for APIView handler methods that turns validation errors into the
+    project's standard 400 response.
+    Args:
+        view_method (callable): The handler method (post, get, patch, delete) to wrap.
+    Returns:
+        callable: The wrapped handler. A DjangoValidationError or DRFValidationError
+            raised inside it is answered with {'success': False, 'message': ...}.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        try:
+            return view_method(self, request, *args, **kwargs)
+        except DjangoValidationError as e:
+            return _error_response(getattr(e, 'message', e.messages))
+        except DRFValidationError as e:
+            return _error_response(e.detail)
+    return wrapper
@@ -0,0 +1,49 @@
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from django.http import HttpResponse
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_drf_json_default = JSONEncoder().default
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, which encodes in C instead of Python.
+    Types orjson does not handle natively (Decimal, lazy translation strings, ...)
+    are converted the same way DRF's JSONRenderer would. Falls back to
+    JSONRenderer when orjson is not installed.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_drf_json_default)
+
+_json_renderer = ORJSONRenderer()
+
+def render_json(data) -> bytes:
+    """
+    Encode a payload to JSON bytes with the shared ORJSONRenderer.
+    Args:
+        data: The payload to encode.
+    Returns:
+        bytes: The encoded JSON.
+    """
+    return _json_renderer.render(data)
+
+def json_response(data, *, status: int) -> HttpResponse:
+    """
+    Build a JSON HttpResponse directly, skipping DRF's content negotiation.
+    Meant for endpoints that only ever answer with JSON.
+    Args:
+        data: The response payload.
+        status (int): HTTP status code.
+    Returns:
+        HttpResponse: The rendered application/json response.
+    """
+    return HttpResponse(render_json(data), content_type='application/json', status=status)
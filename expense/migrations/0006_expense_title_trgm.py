@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+def create_title_trigram_index(apps, schema_editor):
+    # Trigram indexes are PostgreSQL-only; other backends keep the sequential scan.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # `title__icontains` compiles to UPPER("title"::text) LIKE UPPER(%s), so index that expression.
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS expense_title_trgm '
+        'ON expenses USING gin (UPPER("title"::text) gin_trgm_ops)'
+    )
+
+
+def drop_title_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS expense_title_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expense', '0005_expense_wallet'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_trigram_index, drop_title_trigram_index),
+    ]
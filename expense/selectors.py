@@ -33,7 +33,11 @@ def get_user_expense_list(
         DjangoValidationError: If the date format for start_date or end_date is invalid.
         DjangoValidationError: If the date_filter value is invalid.
     """
-    expense_list = user.expense.select_related('category')
+    expense_list = user.expense.select_related('category', 'wallet').only(
+        'uid', 'title', 'description', 'amount', 'created_at', 'updated_at',
+        'category', 'category__uid', 'category__title', 'category__color_code',
+        'wallet', 'wallet__uid', 'wallet__title'
+    )
 
     if title:
         expense_list = expense_list.filter(title__icontains=title)
@@ -98,18 +102,25 @@ def get_user_expense_details(*, user: CustomUser, expense_uid: UUID) -> Dict:
     Raises:
         DjangoValidationError: If the expense with the given UID does not exist.
     """
-    try:
-        expense_instance = user.expense.get(uid=expense_uid)
-    except Expense.DoesNotExist:
+    expense_row = user.expense.filter(uid=expense_uid).values(
+        "uid",
+        "title",
+        "description",
+        "amount",
+        "category__uid",
+        "category__title",
+        "category__color_code",
+    ).first()
+    if expense_row is None:
         raise DjangoValidationError("Expense not found")
     expense_details = {
-        "uid": expense_instance.uid,
-        "title": expense_instance.title,
-        "description": expense_instance.description,
-        "amount": expense_instance.amount,
-        "category": expense_instance.category.uid,
-        "category_title": expense_instance.category.title,
-        "color_code": expense_instance.category.color_code
+        "uid": expense_row["uid"],
+        "title": expense_row["title"],
+        "description": expense_row["description"],
+        "amount": expense_row["amount"],
+        "category": expense_row["category__uid"],
+        "category_title": expense_row["category__title"],
+        "color_code": expense_row["category__color_code"]
     }
     return expense_details
 
@@ -1,28 +1,40 @@
 from dataclasses import dataclass, field
 from datetime import date as date_type
 from decimal import Decimal
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
 from uuid import UUID
 
 from expense.models import Expense
 from income.models import Income
-from wallet.models import TransferTransaction
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryData:
     uid: UUID
     title: str
     color_code: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'uid': self.uid,
+            'title': self.title,
+            'color_code': self.color_code
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class WalletData:
     uid: UUID
     title: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'uid': self.uid,
+            'title': self.title
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class BaseTransaction:
     uid: UUID
     date: date_type
@@ -31,12 +43,29 @@ class BaseTransaction:
     description: Optional[str]
     transaction_type: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'uid': self.uid,
+            'date': self.date,
+            'title': self.title,
+            'amount': self.amount,
+            'description': self.description,
+            'transaction_type': self.transaction_type
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ExpenseTransactionData(BaseTransaction):
     category: Optional[CategoryData] = None
     wallet: Optional[WalletData] = None
     
+    def to_dict(self) -> Dict[str, Any]:
+        # Zero-argument super() is unavailable in slotted dataclasses
+        data = BaseTransaction.to_dict(self)
+        data['category'] = self.category.to_dict() if self.category else None
+        data['wallet'] = self.wallet.to_dict() if self.wallet else None
+        return data
+    
     @classmethod
     def from_expense(cls, expense: Expense) -> 'ExpenseTransactionData':
         category_data = None
@@ -66,11 +95,18 @@ class ExpenseTransactionData(BaseTransaction):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomeTransactionData(BaseTransaction):
     category: Optional[CategoryData] = None
     wallet: Optional[WalletData] = None
     
+    def to_dict(self) -> Dict[str, Any]:
+        # Zero-argument super() is unavailable in slotted dataclasses
+        data = BaseTransaction.to_dict(self)
+        data['category'] = self.category.to_dict() if self.category else None
+        data['wallet'] = self.wallet.to_dict() if self.wallet else None
+        return data
+    
     @classmethod
     def from_income(cls, income: Income) -> 'IncomeTransactionData':
         category_data = None
@@ -100,44 +136,43 @@ class IncomeTransactionData(BaseTransaction):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferTransactionData(BaseTransaction):
     source_wallet: Optional[WalletData] = None
     destination_wallet: Optional[WalletData] = None
     
+    def to_dict(self) -> Dict[str, Any]:
+        data = BaseTransaction.to_dict(self)
+        data['source_wallet'] = self.source_wallet.to_dict() if self.source_wallet else None
+        data['destination_wallet'] = self.destination_wallet.to_dict() if self.destination_wallet else None
+        return data
+    
     @classmethod
-    def from_transfer(cls, transfer: TransferTransaction) -> 'TransferTransactionData':
-        source_wallet_data = None
-        if transfer.source_wallet:
-            source_wallet_data = WalletData(
-                uid=transfer.source_wallet.uid,
-                title=transfer.source_wallet.title
-            )
-        
-        destination_wallet_data = None
-        if transfer.destination_wallet:
-            destination_wallet_data = WalletData(
-                uid=transfer.destination_wallet.uid,
-                title=transfer.destination_wallet.title
-            )
+    def from_transfer(
+        cls,
+        transfer: Dict[str, Any],
+        wallets: Dict[int, WalletData]
+    ) -> 'TransferTransactionData':
+        source_wallet_data = wallets.get(transfer['source_wallet_id'])
+        destination_wallet_data = wallets.get(transfer['destination_wallet_id'])
         
         title = "Transfer"
-        if transfer.source_wallet and transfer.destination_wallet:
-            title = f"Transfer: {transfer.source_wallet.title} → {transfer.destination_wallet.title}"
+        if source_wallet_data and destination_wallet_data:
+            title = f"Transfer: {source_wallet_data.title} → {destination_wallet_data.title}"
         
         return cls(
-            uid=transfer.uid,
-            date=transfer.date,
+            uid=transfer['uid'],
+            date=transfer['date'],
             title=title,
-            amount=transfer.amount,
-            description=transfer.description,
+            amount=transfer['amount'],
+            description=transfer['description'],
             transaction_type='transfer',
             source_wallet=source_wallet_data,
             destination_wallet=destination_wallet_data
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DateGroup:
     date: date_type
     amount: Decimal = Decimal('0')
@@ -1,24 +1,39 @@
-from typing import Dict, List
-from collections import defaultdict
+from functools import lru_cache
+from datetime import date as date_type
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from django.db.models import Sum
 
 from rest_framework.exceptions import ValidationError as DRFValidationError
 
 from income.models import Income
 from expense.models import Expense
 from account.models import CustomUser
-from wallet.models import TransferTransaction
+from wallet.models import Wallet, TransferTransaction
 
 from .dataclasses import (
     ExpenseTransactionData,
     IncomeTransactionData,
     TransferTransactionData,
+    WalletData,
     DateGroup
 )
 
 
+@lru_cache(maxsize=64)
+def _month_range(year: int, month: Optional[int]) -> Tuple[date_type, date_type]:
+    """Half-open `[start, end)` date range covering a month, or the whole year when month is None."""
+    if month is None:
+        return date_type(year, 1, 1), date_type(year + 1, 1, 1)
+    if month == 12:
+        return date_type(year, 12, 1), date_type(year + 1, 1, 1)
+    return date_type(year, month, 1), date_type(year, month + 1, 1)
+
+
 def get_transaction_list(
-    year: str,
-    month: str,
+    year: int,
+    month: Optional[int],
     user: CustomUser,
     transaction_type: str = 'all',
 ) -> List[Dict]:
@@ -27,14 +42,15 @@ def get_transaction_list(
     grouped by date with daily totals.
     
     Args:
-        year (str): Year to filter transactions
-        month (str): Month to filter transactions
+        year (int): Year to filter transactions
+        month (int, optional): Month (1-12) to filter transactions; None for the whole year
         user (CustomUser): User whose transactions to retrieve
         transaction_type (str, optional): Type of transactions to retrieve.
             Valid values are 'all', 'expense', 'income', 'transfer'. Defaults to 'all'.
             
     Returns:
-        list: List of dictionaries containing date, amount, and transactions
+        list: List of response-ready dictionaries containing date, amount
+            (two-place decimal string), and transactions
         
     Raises:
         DRFValidationError: If an invalid transaction type is provided
@@ -45,18 +61,17 @@ def get_transaction_list(
         raise DRFValidationError(detail=f"Invalid transaction type. Valid options are {', '.join(valid_types)}.")
     
     # Dictionary to hold transactions grouped by date
-    date_groups = defaultdict(lambda: DateGroup(date=None))
+    date_groups: Dict[date_type, DateGroup] = {}
     
-    # Create base filters
-    expense_filters = {'user': user, 'date__year': year}
-    income_filters = {'user': user, 'date__year': year}
-    transfer_filters = {'user': user, 'date__year': year}
+    try:
+        start_date, end_date = _month_range(year, month)
+    except (ValueError, OverflowError):
+        raise DRFValidationError(detail="Invalid year or month.")
     
-    # Add month filter if specified
-    if month:
-        expense_filters['date__month'] = month
-        income_filters['date__month'] = month
-        transfer_filters['date__month'] = month
+    # Create base filters as a sargable date range rather than year/month extracts
+    expense_filters = {'user': user, 'date__gte': start_date, 'date__lt': end_date}
+    income_filters = {'user': user, 'date__gte': start_date, 'date__lt': end_date}
+    transfer_filters = {'user': user, 'date__gte': start_date, 'date__lt': end_date}
     
     # Fetch and process expense transactions if needed
     if transaction_type in ('all', 'expense'):
@@ -66,8 +81,10 @@ def get_transaction_list(
         
         for expense in expenses:
             transaction = ExpenseTransactionData.from_expense(expense)
-            date_group = date_groups[expense.date]
-            date_group.date = expense.date
+            date_group = date_groups.get(expense.date)
+            if date_group is None:
+                date_group = DateGroup(date=expense.date, amount=Decimal('0'), transactions=[])
+                date_groups[expense.date] = date_group
             date_group.amount -= expense.amount
             date_group.transactions.append(transaction)
     
@@ -79,21 +96,34 @@ def get_transaction_list(
         
         for income in incomes:
             transaction = IncomeTransactionData.from_income(income)
-            date_group = date_groups[income.date]
-            date_group.date = income.date
+            date_group = date_groups.get(income.date)
+            if date_group is None:
+                date_group = DateGroup(date=income.date, amount=Decimal('0'), transactions=[])
+                date_groups[income.date] = date_group
             date_group.amount += income.amount
             date_group.transactions.append(transaction)
     
     # Fetch and process transfer transactions if needed
     if transaction_type in ('all', 'transfer'):
-        transfers = (TransferTransaction.objects.filter(**transfer_filters)
-         .select_related('source_wallet', 'destination_wallet')
+        transfers = list(TransferTransaction.objects.filter(**transfer_filters)
+         .values('uid', 'date', 'amount', 'description', 'source_wallet_id', 'destination_wallet_id')
          .order_by('date'))
         
+        # Load every wallet referenced by the transfers once instead of joining per row
+        wallet_ids = {transfer['source_wallet_id'] for transfer in transfers}
+        wallet_ids |= {transfer['destination_wallet_id'] for transfer in transfers}
+        wallet_ids.discard(None)
+        wallets = {
+            wallet.id: WalletData(uid=wallet.uid, title=wallet.title)
+            for wallet in Wallet.objects.filter(id__in=wallet_ids).only('id', 'uid', 'title')
+        } if wallet_ids else {}
+        
         for transfer in transfers:
-            transaction = TransferTransactionData.from_transfer(transfer)
-            date_group = date_groups[transfer.date]
-            date_group.date = transfer.date
+            transaction = TransferTransactionData.from_transfer(transfer, wallets)
+            date_group = date_groups.get(transfer['date'])
+            if date_group is None:
+                date_group = DateGroup(date=transfer['date'], amount=Decimal('0'), transactions=[])
+                date_groups[transfer['date']] = date_group
             # Transfers don't affect the daily total
             date_group.transactions.append(transaction)
     
@@ -102,32 +132,76 @@ def get_transaction_list(
     for date in sorted(date_groups.keys()):
         group = date_groups[date]
         
-        # Convert transactions to serializable dictionaries
-        transaction_dicts = []
-        for transaction in group.transactions:
-            # Convert dataclass to dict, handling nested dataclasses
-            transaction_dict = transaction.__dict__.copy()
-            
-            # Handle nested dataclasses for expense/income transactions
-            if isinstance(transaction, (ExpenseTransactionData, IncomeTransactionData)):
-                if transaction.category:
-                    transaction_dict['category'] = transaction.category.__dict__
-                if transaction.wallet:
-                    transaction_dict['wallet'] = transaction.wallet.__dict__
-                    
-            # Handle nested dataclasses for transfer transactions
-            elif isinstance(transaction, TransferTransactionData):
-                if transaction.source_wallet:
-                    transaction_dict['source_wallet'] = transaction.source_wallet.__dict__
-                if transaction.destination_wallet:
-                    transaction_dict['destination_wallet'] = transaction.destination_wallet.__dict__
-            
-            transaction_dicts.append(transaction_dict)
+        # Each transaction dataclass knows its own serializable shape
+        transaction_dicts = [transaction.to_dict() for transaction in group.transactions]
         
         result.append({
             'date': group.date,
-            'amount': group.amount,
+            # Daily totals are rendered as fixed two-place strings, as the API always has
+            'amount': str(group.amount.quantize(Decimal('0.01'))),
             'transactions': transaction_dicts
         })
     
     return result
+
+
+def get_transaction_daily_totals(
+    year: int,
+    month: Optional[int],
+    user: CustomUser,
+    transaction_type: str = 'all',
+) -> List[Dict]:
+    """
+    Get the net income/expense total per day for a user for a specific month
+    and year, aggregated in the database instead of per transaction.
+    
+    Args:
+        year (int): Year to filter transactions
+        month (int, optional): Month (1-12) to filter transactions; None for the whole year
+        user (CustomUser): User whose totals to retrieve
+        transaction_type (str, optional): Type of transactions to total.
+            Valid values are 'all', 'expense', 'income', 'transfer'. Defaults to 'all'.
+            
+    Returns:
+        list: List of dictionaries containing date and amount (two-place decimal string),
+            ordered by date. Transfers don't affect totals, so days with only
+            transfers are omitted.
+        
+    Raises:
+        DRFValidationError: If an invalid transaction type is provided
+    """
+    valid_types = {'all', 'expense', 'income', 'transfer'}
+    if transaction_type not in valid_types:
+        raise DRFValidationError(detail=f"Invalid transaction type. Valid options are {', '.join(valid_types)}.")
+    
+    try:
+        start_date, end_date = _month_range(year, month)
+    except (ValueError, OverflowError):
+        raise DRFValidationError(detail="Invalid year or month.")
+    
+    filters = {'user': user, 'date__gte': start_date, 'date__lt': end_date}
+    daily_totals: Dict[date_type, Decimal] = {}
+    
+    if transaction_type in ('all', 'expense'):
+        expense_totals = (Expense.objects.filter(**filters)
+                          .values('date')
+                          .annotate(total=Sum('amount'))
+                          .order_by())
+        for row in expense_totals:
+            daily_totals[row['date']] = daily_totals.get(row['date'], Decimal('0')) - row['total']
+    
+    if transaction_type in ('all', 'income'):
+        income_totals = (Income.objects.filter(**filters)
+                         .values('date')
+                         .annotate(total=Sum('amount'))
+                         .order_by())
+        for row in income_totals:
+            daily_totals[row['date']] = daily_totals.get(row['date'], Decimal('0')) + row['total']
+    
+    return [
+        {
+            'date': date,
+            'amount': str(daily_totals[date].quantize(Decimal('0.01')))
+        }
+        for date in sorted(daily_totals)
+    ]
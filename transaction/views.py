@@ -1,56 +1,54 @@
 from django.shortcuts import render
 from django.utils.timezone import now
-from django.core.exceptions import ValidationError as DjangoValidationError
 
 from rest_framework import status
-from rest_framework import serializers
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import ValidationError as DRFValidationError
 
-from .selectors import get_transaction_list
+from core.decorators import api_error_handler
+
+from .selectors import get_transaction_list, get_transaction_daily_totals
 
 class FetchTransactionViewAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
-    class FetchTransactionOutputSerializer(serializers.Serializer):
-        date = serializers.DateField()
-        amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-        transactions = serializers.ListField(child=serializers.DictField())
-
+    @api_error_handler
     def get(self, request, *args, **kwargs):
+        # Get parameters from query string instead of URL path
+        year = request.query_params.get('year')
+        month = request.query_params.get('month', str(now().month))
         try:
-            # Get parameters from query string instead of URL path
-            transaction_data = get_transaction_list(
-                user=request.user,
-                transaction_type=kwargs.get('transaction_type', request.query_params.get('transaction_type', 'all')),
-                year=request.query_params.get('year', str(now().year)),
-                month=request.query_params.get('month', str(now().month))
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    "success": False,
-                    "message": e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    "success": False,
-                    "message": e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            year = int(year) if year else now().year
+            # An explicitly empty month fetches the whole year
+            month = int(month) if month else None
+        except ValueError:
+            raise DRFValidationError(detail="Year and month must be integers.")
+        # The range for December ends on 1 January of the next year, so 9998 is the last usable year
+        if not 1 <= year <= 9998:
+            raise DRFValidationError(detail="Year must be between 1 and 9998.")
+        if month is not None and not 1 <= month <= 12:
+            raise DRFValidationError(detail="Month must be between 1 and 12.")
+
+        # `?summary=1` returns only per-day totals, aggregated in the database
+        if request.query_params.get('summary') in ('1', 'true'):
+            selector = get_transaction_daily_totals
+        else:
+            selector = get_transaction_list
+
+        transaction_data = selector(
+            user=request.user,
+            transaction_type=kwargs.get('transaction_type', request.query_params.get('transaction_type', 'all')),
+            year=year,
+            month=month
+        )
             
-        serializer = self.FetchTransactionOutputSerializer(transaction_data, many=True)
         return Response(
             {
                 "success": True,
                 "message": "Transactions list fetched successfully",
-                "data": serializer.data
+                "data": transaction_data
             },
             status=status.HTTP_200_OK
         )
\ No newline at end of file
@@ -0,0 +1,16 @@
+from hashlib import md5
+
+WALLET_LIST_CACHE_TIMEOUT = 300
+
+def get_wallet_list_cache_key(*, user_id: int, version: str) -> str:
+    """
+    Build the cache key holding a user's wallet list at a given list version.
+    Any wallet write changes the version, so readers move to a fresh entry and
+    the cached body always matches an ETag built from the same version.
+    Args:
+        user_id (int): Primary key of the wallet owner.
+        version (str): Fingerprint from get_wallet_list_version.
+    Returns:
+        str: The cache key.
+    """
+    return f"wallets:{user_id}:{md5(version.encode(), usedforsecurity=False).hexdigest()}"
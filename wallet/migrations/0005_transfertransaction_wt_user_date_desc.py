@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-16 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallet', '0004_transfertransaction'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transfertransaction',
+            index=models.Index(fields=['user', '-date'], name='wt_user_date_desc'),
+        ),
+    ]
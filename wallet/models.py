@@ -1,8 +1,8 @@
 from decimal import Decimal
 
-from django.db import transaction
 from django.utils import timezone
 from django.db import models
+from django.db.models import Case, F, When
 
 from core.models_mixin import IdentifierTimeStampAbstractModel
 
@@ -15,23 +15,39 @@ class Wallet(IdentifierTimeStampAbstractModel):
     def __str__(self):
         return self.title
     
-    @transaction.atomic
     def deposit(self, amount: Decimal):
         """Add amount to wallet balance"""
-        self.balance += amount
-        self.save()
+        type(self).objects.filter(pk=self.pk).update(
+            balance=F('balance') + amount,
+            updated_at=timezone.now()
+        )
+        self.refresh_from_db(fields=['balance'])
         
-    @transaction.atomic
     def withdraw(self, amount: Decimal):
         """Subtract amount from wallet balance"""
-        self.balance -= amount
-        self.save()
+        type(self).objects.filter(pk=self.pk).update(
+            balance=F('balance') - amount,
+            updated_at=timezone.now()
+        )
+        self.refresh_from_db(fields=['balance'])
     
-    @transaction.atomic
     def transfer_balance(self, to_wallet, amount: Decimal):
-        """Transfer amount from this wallet to another wallet"""
-        self.withdraw(amount)
-        to_wallet.deposit(amount)
+        """
+        Transfer amount from this wallet to another wallet.
+
+        Both balances are moved by a single UPDATE computed in the database, so
+        nothing is read back; the in-memory balances are adjusted by the same
+        amount and are exact when the caller holds row locks on both wallets.
+        """
+        type(self).objects.filter(pk__in=[self.pk, to_wallet.pk]).update(
+            balance=Case(
+                When(pk=self.pk, then=F('balance') - amount),
+                default=F('balance') + amount
+            ),
+            updated_at=timezone.now()
+        )
+        self.balance -= amount
+        to_wallet.balance += amount
     
     class Meta:
         db_table="user_wallet"
@@ -61,4 +77,7 @@ class TransferTransaction(IdentifierTimeStampAbstractModel):
     class Meta:
         db_table = "wallet_transfers"
         verbose_name = "Wallet Transfer"
-        verbose_name_plural = "Wallet Transfers"
\ No newline at end of file
+        verbose_name_plural = "Wallet Transfers"
+        indexes = [
+            models.Index(fields=['user', '-date'], name='wt_user_date_desc'),
+        ]
\ No newline at end of file
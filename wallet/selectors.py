@@ -1,41 +1,104 @@
 from uuid import UUID
 
+from django.core.cache import cache
+from django.db.models import Count, Max, QuerySet
+
 from account.models import CustomUser
 
 from .models import Wallet, TransferTransaction
+from .helpers import WALLET_LIST_CACHE_TIMEOUT, get_wallet_list_cache_key
+
+WALLET_OUTPUT_FIELDS = ('uid', 'title', 'balance', 'color')
+
+def _wallet_output_rows(wallets: QuerySet[Wallet]) -> list[dict]:
+    """Response-ready wallet rows; balance is rendered as a two-place string, as the API always has."""
+    return [
+        {**row, 'balance': str(row['balance'])}
+        for row in wallets.values(*WALLET_OUTPUT_FIELDS)
+    ]
 
 def get_wallet_from_uid_and_user(wallet_uid:UUID,user:CustomUser) -> Wallet:
     try:
-        wallet_instance = Wallet.objects.get(uid=wallet_uid, user=user)
+        wallet_instance = Wallet.objects.only(
+            'uid', 'title', 'balance', 'color', 'user', 'updated_at'
+        ).get(uid=wallet_uid, user=user)
     except Wallet.DoesNotExist:
         return None
     return wallet_instance
 
-def fetch_wallet_list(user:CustomUser) -> list[Wallet]:
-    try:
-        wallets = user.wallet.all()
-    except Wallet.DoesNotExist:
-        return []
-    return wallets
+def get_wallets_by_uids(
+    *,
+    wallet_uids: list[UUID],
+    user: CustomUser,
+    for_update: bool = False
+) -> dict[UUID, Wallet]:
+    """
+    Get several of a user's wallets in a single query.
+    
+    Args:
+        wallet_uids (list[UUID]): UIDs of the wallets to retrieve.
+        user (CustomUser): User who owns the wallets.
+        for_update (bool, optional): Lock the wallet rows with SELECT ... FOR UPDATE
+            until the surrounding transaction ends. Rows are locked in UID order so
+            concurrent transfers between the same wallets cannot deadlock. Defaults to False.
+        
+    Returns:
+        dict[UUID, Wallet]: Wallets keyed by UID; UIDs that were not found are absent.
+            Only the columns the transfer path reads are loaded.
+    """
+    wallets = Wallet.objects.filter(uid__in=wallet_uids, user=user).only('uid', 'title', 'balance', 'user')
+    if for_update:
+        wallets = wallets.select_for_update().order_by('uid')
+    return {wallet.uid: wallet for wallet in wallets}
 
-def fetch_wallet_detail(wallet_uid:UUID,user:CustomUser) -> Wallet:
-    try:
-        wallet_instance = Wallet.objects.get(uid=wallet_uid, user=user)
-    except Wallet.DoesNotExist:
-        return None
-    return wallet_instance
+def fetch_wallet_list(user:CustomUser, version:str) -> list[dict]:
+    # Cached per user and list version, so a wallet change never reads an older entry
+    return cache.get_or_set(
+        get_wallet_list_cache_key(user_id=user.pk, version=version),
+        lambda: _wallet_output_rows(user.wallet.order_by('id')),
+        WALLET_LIST_CACHE_TIMEOUT
+    )
 
-def get_wallet_from_uid_and_user(wallet_uid:UUID,user:CustomUser) -> Wallet:
-    try:
-        wallet_instance = Wallet.objects.get(uid=wallet_uid, user=user)
-    except Wallet.DoesNotExist:
-        return None
-    return wallet_instance
+def fetch_wallet_detail(wallet_uid:UUID,user:CustomUser) -> dict | None:
+    wallet_rows = _wallet_output_rows(Wallet.objects.filter(uid=wallet_uid, user=user)[:1])
+    return wallet_rows[0] if wallet_rows else None
+
+
+def get_wallet_list_version(*, user: CustomUser) -> str:
+    """
+    Get a cheap fingerprint of a user's wallets that changes whenever any
+    wallet is created, updated (including balance changes) or deleted.
+    
+    Args:
+        user (CustomUser): The user whose wallets to fingerprint.
+        
+    Returns:
+        str: The fingerprint.
+    """
+    state = Wallet.objects.filter(user=user).aggregate(
+        last_updated=Max('updated_at'), total=Count('id')
+    )
+    return f"{state['total']}:{state['last_updated']}"
 
+def get_transfer_list_version(*, user: CustomUser) -> str:
+    """
+    Get a cheap fingerprint of a user's transfer list. Wallet changes are
+    included because the list embeds wallet titles.
+    
+    Args:
+        user (CustomUser): The user whose transfers to fingerprint.
+        
+    Returns:
+        str: The fingerprint.
+    """
+    state = TransferTransaction.objects.filter(user=user).aggregate(
+        last_updated=Max('updated_at'), total=Count('id')
+    )
+    return f"{state['total']}:{state['last_updated']}:{get_wallet_list_version(user=user)}"
 
 def get_transfer_list(*, user: CustomUser):
     """
-    Get all transfers for a user.
+    Get all transfers for a user, newest first so pages are stable.
     
     Args:
         user (CustomUser): The user whose transfers to retrieve.
@@ -43,19 +106,23 @@ def get_transfer_list(*, user: CustomUser):
     Returns:
         QuerySet: QuerySet of TransferTransaction objects.
     """
-    try:
-        transfers = TransferTransaction.objects.filter(user=user)
-    except TransferTransaction.DoesNotExist:
-        return []
-    return transfers
+    return TransferTransaction.objects.filter(user=user).select_related(
+        'source_wallet', 'destination_wallet'
+    ).only(
+        'uid', 'date', 'amount', 'description', 'created_at',
+        'source_wallet', 'source_wallet__uid', 'source_wallet__title',
+        'destination_wallet', 'destination_wallet__uid', 'destination_wallet__title'
+    ).order_by('-date', '-id')
     
-def get_transfer_detail(*, transfer_uid: UUID, user: CustomUser) -> TransferTransaction:
+def get_transfer_detail(*, transfer_uid: UUID, user: CustomUser, for_update: bool = False) -> TransferTransaction:
     """
     Get details of a specific transfer.
     
     Args:
         transfer_uid (UUID): UID of the transfer.
         user (CustomUser): User who owns the transfer.
+        for_update (bool, optional): Lock the transfer row (not its wallets) with
+            SELECT ... FOR UPDATE until the surrounding transaction ends. Defaults to False.
         
     Returns:
         TransferTransaction: The transfer transaction.
@@ -63,8 +130,18 @@ def get_transfer_detail(*, transfer_uid: UUID, user: CustomUser) -> TransferTran
     Raises:
         DRFValidationError: If transfer not found.
     """
+    transfers = TransferTransaction.objects.all()
+    if for_update:
+        # `of` keeps the lock off the outer-joined wallet rows
+        transfers = transfers.select_for_update(of=('self',))
     try:
-        transfer = TransferTransaction.objects.get(uid=transfer_uid, user=user)
+        transfer = transfers.select_related(
+            'source_wallet', 'destination_wallet'
+        ).only(
+            'uid', 'date', 'amount', 'description', 'created_at', 'updated_at',
+            'source_wallet', 'source_wallet__uid', 'source_wallet__title', 'source_wallet__balance',
+            'destination_wallet', 'destination_wallet__uid', 'destination_wallet__title', 'destination_wallet__balance'
+        ).get(uid=transfer_uid, user=user)
     except TransferTransaction.DoesNotExist:
         return None
     return transfer
\ No newline at end of file
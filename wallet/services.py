@@ -1,7 +1,8 @@
 from decimal import Decimal
 from uuid import UUID
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from django.core.exceptions import ValidationError as DjangoValidationError
 
 from rest_framework.exceptions import ValidationError as DRFValidationError
@@ -9,8 +10,9 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 from account.models import CustomUser
 
 from .models import Wallet, TransferTransaction
-from .selectors import get_wallet_from_uid_and_user, get_transfer_detail
+from .selectors import get_wallet_from_uid_and_user, get_wallets_by_uids, get_transfer_detail
 
+@transaction.atomic
 def create_wallet(
     *, 
     title:str, 
@@ -26,11 +28,17 @@ def create_wallet(
         user = user
     )
 
+    # Title uniqueness is enforced by the database constraint, as in update_wallet
     try:
-        wallet_instance.full_clean()
-        wallet_instance.save()
+        wallet_instance.full_clean(validate_unique=False)
     except DjangoValidationError as e:
-        raise DjangoValidationError(detail=e.messages[0])
+        raise DjangoValidationError(e.messages[0])
+
+    try:
+        with transaction.atomic():
+            wallet_instance.save()
+    except IntegrityError:
+        raise DRFValidationError(detail="Wallet with this title already exists.")
 
     return wallet_instance 
 
@@ -52,12 +60,20 @@ def update_wallet(
     wallet_instance.balance = balance
     wallet_instance.color = color
 
+    # Only the edited fields need validating; title uniqueness is enforced by the
+    # database constraint instead of a validate_unique() query
     try:
-        wallet_instance.full_clean()
-        wallet_instance.save()
+        wallet_instance.clean_fields(exclude=['uid', 'user', 'created_at', 'updated_at'])
+        wallet_instance.clean()
     except DjangoValidationError as e:
         raise DjangoValidationError(e.messages[0])
     
+    try:
+        with transaction.atomic():
+            wallet_instance.save()
+    except IntegrityError:
+        raise DRFValidationError(detail="Wallet with this title already exists.")
+    
     return True
     
 @transaction.atomic
@@ -73,6 +89,30 @@ def delete_wallet(
     wallet_instance.delete()
     return True
 
+def _lock_transfer_wallets(*, transfer: TransferTransaction, user: CustomUser) -> dict[UUID, Wallet]:
+    """Row-lock both wallets of a transfer for the rest of the current transaction."""
+    return get_wallets_by_uids(
+        wallet_uids=[transfer.source_wallet.uid, transfer.destination_wallet.uid],
+        user=user,
+        for_update=True
+    )
+
+def _get_locked_transfer(*, transfer_uid: UUID, user: CustomUser) -> tuple[TransferTransaction | None, dict[UUID, Wallet]]:
+    """
+    Row-lock a transfer's wallets, then re-read the transfer under its own row lock.
+    Wallets are locked first, in the same order create_transfer uses, and the
+    transfer is read only afterwards so its amount reflects any concurrent update
+    or deletion that committed while waiting for the locks.
+    """
+    transfer = get_transfer_detail(transfer_uid=transfer_uid, user=user)
+    if transfer is None:
+        return None, {}
+    wallets = {}
+    if transfer.source_wallet and transfer.destination_wallet:
+        wallets = _lock_transfer_wallets(transfer=transfer, user=user)
+    transfer = get_transfer_detail(transfer_uid=transfer_uid, user=user, for_update=True)
+    return transfer, wallets
+
 @transaction.atomic
 def create_transfer(
     *,
@@ -96,24 +136,35 @@ def create_transfer(
         TransferTransaction: The created transfer transaction.
         
     Raises:
-        DRFValidationError: If source or destination wallet not found.
+        DRFValidationError: If source or destination wallet not found, or the
+            source wallet balance is lower than the amount.
     """
     # Validate the amount
     if amount <= 0:
         raise DRFValidationError(detail="Transfer amount must be greater than zero.")
         
-    # Get source and destination wallets
-    source_wallet = get_wallet_from_uid_and_user(wallet_uid=source_wallet_uid, user=user)
+    # Get and lock source and destination wallets in one query
+    wallets = get_wallets_by_uids(
+        wallet_uids=[source_wallet_uid, destination_wallet_uid],
+        user=user,
+        for_update=True
+    )
+    
+    source_wallet = wallets.get(source_wallet_uid)
     if not source_wallet:
         raise DRFValidationError(detail="Source wallet not found.")
         
-    destination_wallet = get_wallet_from_uid_and_user(wallet_uid=destination_wallet_uid, user=user)
+    destination_wallet = wallets.get(destination_wallet_uid)
     if not destination_wallet:
         raise DRFValidationError(detail="Destination wallet not found.")
     
     if source_wallet == destination_wallet:
         raise DRFValidationError(detail="Source and destination wallets cannot be the same.")
     
+    # The source row is locked, so its loaded balance is current
+    if source_wallet.balance < amount:
+        raise DRFValidationError(detail="Insufficient balance in source wallet.")
+    
     # Perform the transfer
     source_wallet.transfer_balance(destination_wallet, amount)
     
@@ -122,15 +173,17 @@ def create_transfer(
         source_wallet=source_wallet,
         destination_wallet=destination_wallet,
         amount=amount,
-        description=description.strip() if description and description.strip() else None,
+        # The input serializer already trims whitespace, so only blank needs mapping
+        description=description or None,
         user=user,
+        # The model default is timezone.now, a datetime that full_clean() would
+        # have narrowed; set the date explicitly since full_clean() is skipped
+        date=timezone.localdate(),
     )
     
-    try:
-        transfer.full_clean()
-        transfer.save()
-    except DjangoValidationError as e:
-        raise DjangoValidationError(message=e.messages)
+    # Fields are validated by the input serializer and both wallets were just
+    # fetched, so full_clean() would only repeat foreign-key lookups
+    transfer.save()
         
     return transfer
 
@@ -155,32 +208,46 @@ def update_transfer(
         TransferTransaction: The updated transfer transaction.
         
     Raises:
-        DRFValidationError: If transfer not found or amount is invalid.
+        DRFValidationError: If transfer not found, amount is invalid, or the
+            wallet the difference is taken from has too little balance.
     """
-    transfer = get_transfer_detail(transfer_uid=transfer_uid, user=user)
+    if amount is None:
+        # Only the description changes, so no balances need locking; the transfer row
+        # lock makes a concurrent amount update commit first rather than be overwritten
+        transfer = get_transfer_detail(transfer_uid=transfer_uid, user=user, for_update=True)
+    else:
+        transfer, wallets = _get_locked_transfer(transfer_uid=transfer_uid, user=user)
+    if not transfer:
+        raise DRFValidationError(detail="Transfer not found.")
     
     if amount is not None:
         if amount <= 0:
             raise DRFValidationError(detail="Transfer amount must be greater than zero.")
         
-        # Reverse previous transfer
-        if transfer.destination_wallet and transfer.source_wallet:
-            transfer.destination_wallet.transfer_balance(transfer.source_wallet, transfer.amount)
-        
-        # Perform new transfer
-        if transfer.source_wallet and transfer.destination_wallet:
-            transfer.source_wallet.transfer_balance(transfer.destination_wallet, amount)
+        # Apply only the difference instead of reversing and re-applying the transfer
+        delta = amount - transfer.amount
+        if delta and transfer.source_wallet and transfer.destination_wallet:
+            source_wallet = wallets[transfer.source_wallet.uid]
+            destination_wallet = wallets[transfer.destination_wallet.uid]
+            
+            if delta > 0 and source_wallet.balance < delta:
+                raise DRFValidationError(detail="Insufficient balance in source wallet.")
+            # A lower amount pulls the difference back out of the destination wallet
+            if delta < 0 and destination_wallet.balance < -delta:
+                raise DRFValidationError(detail="Insufficient balance in destination wallet.")
+            
+            source_wallet.transfer_balance(destination_wallet, delta)
         
         transfer.amount = amount
         
     if description is not None:
-        transfer.description = description.strip() if description and description.strip() else None
+        transfer.description = description or None
     
-    try:
-        transfer.full_clean()
+    if amount is None:
+        # Write back only what changed, so a stale amount is never saved over a newer one
+        transfer.save(update_fields=['description', 'updated_at'])
+    else:
         transfer.save()
-    except DjangoValidationError as e:
-        raise DjangoValidationError(message=e.messages)
         
     return transfer
 
@@ -197,15 +264,20 @@ def delete_transfer(*, transfer_uid: UUID, user: CustomUser) -> bool:
         bool: True if deletion was successful.
         
     Raises:
-        DRFValidationError: If transfer not found.
+        DRFValidationError: If transfer not found, or the destination wallet no
+            longer holds enough balance to return the amount.
     """
-    transfer = get_transfer_detail(transfer_uid=transfer_uid, user=user)
+    transfer, wallets = _get_locked_transfer(transfer_uid=transfer_uid, user=user)
     if not transfer:
         raise DRFValidationError(detail="Transfer not found.")
     
     # Reverse the transfer
     if transfer.source_wallet and transfer.destination_wallet:
-        transfer.destination_wallet.transfer_balance(transfer.source_wallet, transfer.amount)
+        source_wallet = wallets[transfer.source_wallet.uid]
+        destination_wallet = wallets[transfer.destination_wallet.uid]
+        if destination_wallet.balance < transfer.amount:
+            raise DRFValidationError(detail="Insufficient balance in destination wallet.")
+        destination_wallet.transfer_balance(source_wallet, transfer.amount)
     
     transfer.delete()
     return True
\ No newline at end of file
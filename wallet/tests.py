@@ -1,3 +1,243 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from account.models import CustomUser
+from expense.services import create_user_expense
+
+from .models import Wallet, TransferTransaction
+from .services import create_transfer
+
+class TransferAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="owner@example.com", password="password", username="owner"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.source_wallet = Wallet.objects.create(title="Cash", balance=Decimal("100.00"), user=self.user)
+        self.destination_wallet = Wallet.objects.create(title="Bank", balance=Decimal("10.00"), user=self.user)
+
+    def assertBalances(self, source_balance: str, destination_balance: str):
+        self.source_wallet.refresh_from_db()
+        self.destination_wallet.refresh_from_db()
+        self.assertEqual(self.source_wallet.balance, Decimal(source_balance))
+        self.assertEqual(self.destination_wallet.balance, Decimal(destination_balance))
+
+class CreateWalletAPITests(TransferAPITestCase):
+    def test_duplicate_title_is_rejected(self):
+        response = self.client.post(
+            reverse('wallet:create-income'), {'title': 'Cash', 'balance': '5.00'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['message'], ["Wallet with this title already exists."])
+        self.assertEqual(Wallet.objects.filter(user=self.user, title='Cash').count(), 1)
+
+class CreateTransferAPITests(TransferAPITestCase):
+    def test_create_transfer_returns_created_transfer(self):
+        response = self.client.post(
+            reverse('wallet:create-transfer'),
+            {
+                'source_wallet_uid': str(self.source_wallet.uid),
+                'destination_wallet_uid': str(self.destination_wallet.uid),
+                'amount': '25.00',
+                'description': 'Savings'
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = response.json()
+        self.assertTrue(body['success'])
+        self.assertEqual(body['data']['amount'], '25.00')
+        self.assertEqual(body['data']['description'], 'Savings')
+        self.assertEqual(body['data']['date'], timezone.localdate().isoformat())
+        self.assertEqual(body['data']['source_wallet']['uid'], str(self.source_wallet.uid))
+        self.assertEqual(body['data']['destination_wallet']['uid'], str(self.destination_wallet.uid))
+
+        self.assertBalances("75.00", "35.00")
+        self.assertEqual(TransferTransaction.objects.filter(user=self.user).count(), 1)
+
+    def test_create_transfer_rejects_overdraft(self):
+        response = self.client.post(
+            reverse('wallet:create-transfer'),
+            {
+                'source_wallet_uid': str(self.source_wallet.uid),
+                'destination_wallet_uid': str(self.destination_wallet.uid),
+                'amount': '100.01'
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['message'], ["Insufficient balance in source wallet."])
+        self.assertBalances("100.00", "10.00")
+        self.assertFalse(TransferTransaction.objects.filter(user=self.user).exists())
+
+class UpdateTransferAPITests(TransferAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.transfer = create_transfer(
+            source_wallet_uid=self.source_wallet.uid,
+            destination_wallet_uid=self.destination_wallet.uid,
+            amount=Decimal("25.00"),
+            user=self.user
+        )
+
+    def patch_transfer(self, data: dict):
+        return self.client.patch(
+            reverse('wallet:update-transfer', kwargs={'transfer_uid': self.transfer.uid}),
+            data,
+            format='json'
+        )
+
+    def test_raising_amount_moves_only_the_difference(self):
+        response = self.patch_transfer({'amount': '40.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['amount'], '40.00')
+        self.assertBalances("60.00", "50.00")
+
+    def test_lowering_amount_returns_the_difference(self):
+        response = self.patch_transfer({'amount': '10.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['amount'], '10.00')
+        self.assertBalances("90.00", "20.00")
+
+    def test_unchanged_amount_leaves_balances(self):
+        response = self.patch_transfer({'amount': '25.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBalances("75.00", "35.00")
+
+    def test_raising_amount_beyond_source_balance_is_rejected(self):
+        response = self.patch_transfer({'amount': '100.01'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['message'], ["Insufficient balance in source wallet."])
+        self.assertBalances("75.00", "35.00")
+
+    def test_lowering_amount_beyond_destination_balance_is_rejected(self):
+        # The destination has since spent most of what it received
+        Wallet.objects.filter(pk=self.destination_wallet.pk).update(balance=Decimal("5.00"))
+
+        response = self.patch_transfer({'amount': '10.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['message'], ["Insufficient balance in destination wallet."])
+        self.assertBalances("75.00", "5.00")
+        self.transfer.refresh_from_db()
+        self.assertEqual(self.transfer.amount, Decimal("25.00"))
+
+    def test_description_only_update_keeps_amount(self):
+        response = self.patch_transfer({'description': 'Rent share'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['description'], 'Rent share')
+        self.transfer.refresh_from_db()
+        self.assertEqual(self.transfer.amount, Decimal("25.00"))
+        self.assertEqual(self.transfer.description, 'Rent share')
+        self.assertBalances("75.00", "35.00")
+
+class DeleteTransferAPITests(TransferAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.transfer = create_transfer(
+            source_wallet_uid=self.source_wallet.uid,
+            destination_wallet_uid=self.destination_wallet.uid,
+            amount=Decimal("25.00"),
+            user=self.user
+        )
+
+    def delete_transfer(self):
+        return self.client.delete(
+            reverse('wallet:delete-transfer', kwargs={'transfer_uid': self.transfer.uid})
+        )
+
+    def test_delete_restores_both_balances(self):
+        response = self.delete_transfer()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertBalances("100.00", "10.00")
+        self.assertFalse(TransferTransaction.objects.filter(pk=self.transfer.pk).exists())
+
+    def test_delete_beyond_destination_balance_is_rejected(self):
+        Wallet.objects.filter(pk=self.destination_wallet.pk).update(balance=Decimal("5.00"))
+
+        response = self.delete_transfer()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['message'], ["Insufficient balance in destination wallet."])
+        self.assertBalances("75.00", "5.00")
+        self.assertTrue(TransferTransaction.objects.filter(pk=self.transfer.pk).exists())
+
+class WalletListETagAPITests(TransferAPITestCase):
+    """
+    The wallet list ETag is built from the count and latest updated_at of the user's
+    wallets, so every write has to move it; writes here deliberately touch the older
+    wallet to check updated_at moves past the current maximum.
+    """
+    def get_wallet_list(self, etag: str = None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(reverse('wallet:income-list'), **headers)
+
+    def assertETagChangesAfter(self, write):
+        etag = self.get_wallet_list()['ETag']
+        write()
+        response = self.get_wallet_list(etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        return response.json()['data']
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.get_wallet_list()['ETag']
+
+        response = self.get_wallet_list(etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_after_wallet_create(self):
+        wallets = self.assertETagChangesAfter(lambda: self.client.post(
+            reverse('wallet:create-income'), {'title': 'Card', 'balance': '5.00'}, format='json'
+        ))
+        self.assertIn('Card', [wallet['title'] for wallet in wallets])
+
+    def test_etag_changes_after_wallet_update(self):
+        wallets = self.assertETagChangesAfter(lambda: self.client.patch(
+            reverse('wallet:update-income', kwargs={'wallet_uid': self.source_wallet.uid}),
+            {'title': 'Cash box', 'balance': '100.00'},
+            format='json'
+        ))
+        self.assertIn('Cash box', [wallet['title'] for wallet in wallets])
+
+    def test_etag_changes_after_wallet_delete(self):
+        wallets = self.assertETagChangesAfter(lambda: self.client.delete(
+            reverse('wallet:income-delete', kwargs={'wallet_uid': self.source_wallet.uid})
+        ))
+        self.assertNotIn(str(self.source_wallet.uid), [wallet['uid'] for wallet in wallets])
+
+    def test_etag_changes_after_transfer(self):
+        wallets = self.assertETagChangesAfter(lambda: create_transfer(
+            source_wallet_uid=self.source_wallet.uid,
+            destination_wallet_uid=self.destination_wallet.uid,
+            amount=Decimal("25.00"),
+            user=self.user
+        ))
+        balances = {wallet['uid']: wallet['balance'] for wallet in wallets}
+        self.assertEqual(balances[str(self.source_wallet.uid)], "75.00")
+        self.assertEqual(balances[str(self.destination_wallet.uid)], "35.00")
+
+    def test_etag_changes_after_expense_withdraw(self):
+        wallets = self.assertETagChangesAfter(lambda: create_user_expense(
+            amount=Decimal("5.00"),
+            category=None,
+            wallet=self.source_wallet.uid,
+            user=self.user
+        ))
+        balances = {wallet['uid']: wallet['balance'] for wallet in wallets}
+        self.assertEqual(balances[str(self.source_wallet.uid)], "95.00")
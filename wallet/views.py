@@ -1,6 +1,8 @@
-from django.shortcuts import render
-from django.db import transaction
-from django.core.exceptions import ValidationError as DjangoValidationError
+from hashlib import md5
+
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework import serializers, status
@@ -9,492 +11,286 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.pagination import PageNumberPagination
 
+from core.decorators import api_error_handler
+from core.renderers import ORJSONRenderer, json_response
+
 from .services import create_wallet, update_wallet, delete_wallet, create_transfer, update_transfer, delete_transfer 
-from .selectors import fetch_wallet_list, fetch_wallet_detail, get_transfer_list, get_transfer_detail
+from .selectors import (
+    fetch_wallet_list,
+    fetch_wallet_detail,
+    get_transfer_list,
+    get_transfer_detail,
+    get_wallet_list_version,
+    get_transfer_list_version
+)
 
-class CreateWalletAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+def _list_etag(request, version: str) -> str:
+    """Per-user, per-page ETag so unchanged lists can be answered with 304 Not Modified."""
+    key = f"{request.user.pk}:{request.get_full_path()}:{version}"
+    return md5(key.encode(), usedforsecurity=False).hexdigest()
 
-    class CreateWalletInputSerializer(serializers.Serializer):
-        title = serializers.CharField(write_only=True, required=True)
-        balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
-        color = serializers.CharField(required=False)
+def _wallet_list_version(request) -> str:
+    # condition() builds the ETag before the handler runs; both must use the same version
+    if not hasattr(request, 'wallet_list_version'):
+        request.wallet_list_version = get_wallet_list_version(user=request.user)
+    return request.wallet_list_version
 
-    class CreateWalletOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        title = serializers.UUIDField(read_only=True)
-        balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
-        color = serializers.CharField(read_only=True)
-    
-    @transaction.atomic
+def _wallet_list_etag(request, *args, **kwargs) -> str:
+    return _list_etag(request, _wallet_list_version(request))
+
+def _transfer_list_etag(request, *args, **kwargs) -> str:
+    return _list_etag(request, get_transfer_list_version(user=request.user))
+
+class DefaultPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+# Fixed part of each success envelope; handlers copy it and fill in the payload
+_CREATE_WALLET_OK = {'success': True, 'message': 'New wallet created successfully.'}
+_UPDATE_WALLET_OK = {'success': True, 'message': 'Wallet updated successfully.'}
+_FETCH_WALLET_LIST_OK = {'success': True, 'message': 'Wallets fetched successfully.'}
+_FETCH_WALLET_DETAIL_OK = {'success': True, 'message': 'Wallet details fetched successfully.'}
+_CREATE_TRANSFER_OK = {'success': True, 'message': 'Transfer completed successfully.'}
+_UPDATE_TRANSFER_OK = {'success': True, 'message': 'Transfer updated successfully.'}
+_FETCH_TRANSFER_LIST_OK = {'success': True, 'message': 'Transfers fetched successfully.'}
+_FETCH_TRANSFER_DETAIL_OK = {'success': True, 'message': 'Transfer details fetched successfully.'}
+_DELETE_TRANSFER_OK = {'success': True, 'message': 'Transfer deleted successfully.'}
+
+# IsAuthenticated holds no per-request state, so one instance serves every request
+_AUTHENTICATED_PERMISSIONS = (IsAuthenticated(),)
+
+class WalletBaseView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def get_permissions(self):
+        return _AUTHENTICATED_PERMISSIONS
+
+# Serializers live at module level so their declared fields are built once at import.
+# Output serializers are rendered with to_representation() to skip the ReturnDict/ReturnList copy made by .data
+
+class CreateWalletInputSerializer(serializers.Serializer):
+    title = serializers.CharField(write_only=True, required=True)
+    balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
+    color = serializers.CharField(default="#007bff")
+
+class CreateWalletOutputSerializer(serializers.Serializer):
+    uid = serializers.UUIDField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
+    color = serializers.CharField(read_only=True)
+
+class UpdateWalletInputSerializer(serializers.Serializer):
+    title = serializers.CharField(write_only=True, required=True)
+    balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
+    color = serializers.CharField(write_only=True, default="#007bff")
+
+class WalletRefSerializer(serializers.Serializer):
+    uid = serializers.UUIDField(read_only=True)
+    title = serializers.CharField(read_only=True)
+
+class CreateTransferInputSerializer(serializers.Serializer):
+    source_wallet_uid = serializers.UUIDField(required=True)
+    destination_wallet_uid = serializers.UUIDField(required=True)
+    amount = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
+    description = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+
+class CreateTransferOutputSerializer(serializers.Serializer):
+    uid = serializers.UUIDField(read_only=True)
+    source_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    destination_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
+    description = serializers.CharField(read_only=True)
+    date = serializers.DateField(read_only=True)
+
+class UpdateTransferInputSerializer(serializers.Serializer):
+    amount = serializers.DecimalField(required=False, max_digits=10, decimal_places=2)
+    description = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+
+class UpdateTransferOutputSerializer(serializers.Serializer):
+    uid = serializers.UUIDField(read_only=True)
+    source_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    destination_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
+    description = serializers.CharField(read_only=True)
+    date = serializers.DateField(read_only=True)
+
+class FetchTransferListOutputSerializer(serializers.Serializer):
+    uid = serializers.UUIDField(read_only=True)
+    source_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    destination_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
+    description = serializers.CharField(read_only=True)
+    date = serializers.DateField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+class FetchTransferDetailOutputSerializer(serializers.Serializer):
+    uid = serializers.UUIDField(read_only=True)
+    source_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    destination_wallet = WalletRefSerializer(read_only=True, allow_null=True)
+    amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
+    description = serializers.CharField(read_only=True)
+    date = serializers.DateField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+class CreateWalletAPIView(WalletBaseView):
+    @api_error_handler
     def post(self, request, *args, **kwargs):
-        input_serializer = self.CreateWalletInputSerializer(data=request.data)
+        input_serializer = CreateWalletInputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
 
-        try:
-            wallet = create_wallet(
-                **input_serializer.validated_data,
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        output_serializer = self.CreateWalletOutputSerializer(wallet)
-        return Response(
-            {
-                'success': True,
-                'message': 'New wallet created successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_201_CREATED
+        validated_data = input_serializer.validated_data
+        wallet = create_wallet(
+            title=validated_data['title'],
+            balance=validated_data['balance'],
+            color=validated_data['color'],
+            user=request.user
         )
+        output_serializer = CreateWalletOutputSerializer(wallet)
+        response = _CREATE_WALLET_OK.copy()
+        response['data'] = output_serializer.to_representation(output_serializer.instance)
+        return json_response(response, status=status.HTTP_201_CREATED)
     
-class UpdateWalletAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    class UpdateWalletInputSerializer(serializers.Serializer):
-        title = serializers.CharField(write_only=True, required=True)
-        balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
-        color = serializers.CharField(write_only=True, required=False)
-    
-    @transaction.atomic
+class UpdateWalletAPIView(WalletBaseView):
+    @api_error_handler
     def patch(self, request, *args, **kwargs):
-        input_serializer = self.UpdateWalletInputSerializer(data=request.data)
+        input_serializer = UpdateWalletInputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
 
-        try:
-            wallet_update_status = update_wallet(
-                **input_serializer.validated_data,
-                wallet_uid = kwargs.get('wallet_uid'),
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        return Response(
-            {
-                'success': True,
-                'message': 'Wallet updated successfully.'
-            },
-            status=status.HTTP_201_CREATED
+        validated_data = input_serializer.validated_data
+        update_wallet(
+            title=validated_data['title'],
+            balance=validated_data['balance'],
+            color=validated_data['color'],
+            wallet_uid = kwargs.get('wallet_uid'),
+            user=request.user
         )
+        return json_response(_UPDATE_WALLET_OK, status=status.HTTP_200_OK)
 
-class FetchWalletListAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    class FetchWalletListOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        title = serializers.UUIDField(read_only=True)
-        balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
-        color = serializers.CharField(read_only=True)
+class FetchWalletListAPIView(WalletBaseView):
+    renderer_classes = [ORJSONRenderer]
 
-    @transaction.atomic
+    @method_decorator(condition(etag_func=_wallet_list_etag))
+    @api_error_handler
     def get(self, request, *args, **kwargs):
-        try:
-            wallet_list = fetch_wallet_list(
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        output_serializer = self.FetchWalletListOutputSerializer(wallet_list, many=True)
-        return Response(
-            {
-                'success': True,
-                'message': 'Wallet updated successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_201_CREATED
+        wallet_list = fetch_wallet_list(
+            user=request.user,
+            version=_wallet_list_version(request)
         )
+        paginator = DefaultPagination()
+        # Selector rows are already in response shape
+        paginated_wallets = paginator.paginate_queryset(wallet_list, request, view=self)
+        response = _FETCH_WALLET_LIST_OK.copy()
+        response['count'] = paginator.page.paginator.count
+        response['next'] = paginator.get_next_link()
+        response['previous'] = paginator.get_previous_link()
+        response['data'] = paginated_wallets
+        return Response(response, status=status.HTTP_200_OK)
 
-class FetchWalletDetailAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    class FetchWalletDetailOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        title = serializers.UUIDField(read_only=True)
-        balance = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
-        color = serializers.CharField(read_only=True)
+class FetchWalletDetailAPIView(WalletBaseView):
+    renderer_classes = [ORJSONRenderer]
     
-    @transaction.atomic
+    @api_error_handler
     def get(self, request, *args, **kwargs):
-        try:
-            wallet = fetch_wallet_detail(
-                wallet_uid = kwargs.get('wallet_uid'),
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        output_serializer = self.FetchWalletDetailOutputSerializer(wallet)
-        return Response(
-            {
-                'success': True,
-                'message': 'Wallet updated successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_201_CREATED
+        wallet = fetch_wallet_detail(
+            wallet_uid = kwargs.get('wallet_uid'),
+            user=request.user
         )
+        if wallet is None:
+            raise DRFValidationError(detail="wallet not found.")
+        response = _FETCH_WALLET_DETAIL_OK.copy()
+        response['data'] = wallet
+        return Response(response, status=status.HTTP_200_OK)
 
-class DeleteWalletAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    @transaction.atomic
+class DeleteWalletAPIView(WalletBaseView):
+    @api_error_handler
     def delete(self, request, *args, **kwargs):
-        try:
-            wallet_deletion_status = delete_wallet(
-                wallet_uid = kwargs.get('wallet_uid'),
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        return Response(
-            {
-                'success': True,
-                'message': 'Wallet deleted successfully.'
-            },
-            status=status.HTTP_201_CREATED
+        delete_wallet(
+            wallet_uid = kwargs.get('wallet_uid'),
+            user=request.user
         )
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
     
-class CreateTransferAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-    
-    class CreateTransferInputSerializer(serializers.Serializer):
-        source_wallet_uid = serializers.UUIDField(required=True)
-        destination_wallet_uid = serializers.UUIDField(required=True)
-        amount = serializers.DecimalField(required=True, max_digits=10, decimal_places=2)
-        description = serializers.CharField(required=False, allow_null=True, allow_blank=True)
-        
-    class CreateTransferOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        source_wallet = serializers.SerializerMethodField()
-        destination_wallet = serializers.SerializerMethodField()
-        amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
-        description = serializers.CharField(read_only=True)
-        date = serializers.DateField(read_only=True)
-        
-        def get_source_wallet(self, obj):
-            return {
-                'uid': obj.source_wallet.uid,
-                'title': obj.source_wallet.title
-            } if obj.source_wallet else None
-            
-        def get_destination_wallet(self, obj):
-            return {
-                'uid': obj.destination_wallet.uid,
-                'title': obj.destination_wallet.title
-            } if obj.destination_wallet else None
-    
-    @transaction.atomic
+class CreateTransferAPIView(WalletBaseView):
+    @api_error_handler
     def post(self, request, *args, **kwargs):
-        input_serializer = self.CreateTransferInputSerializer(data=request.data)
+        input_serializer = CreateTransferInputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         
-        try:
-            transfer = create_transfer(
-                **input_serializer.validated_data,
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        output_serializer = self.CreateTransferOutputSerializer(transfer)
-        return Response(
-            {
-                'success': True,
-                'message': 'Transfer completed successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_201_CREATED
+        validated_data = input_serializer.validated_data
+        transfer = create_transfer(
+            source_wallet_uid=validated_data['source_wallet_uid'],
+            destination_wallet_uid=validated_data['destination_wallet_uid'],
+            amount=validated_data['amount'],
+            description=validated_data.get('description'),
+            user=request.user
         )
-
-class UpdateTransferAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-    
-    class UpdateTransferInputSerializer(serializers.Serializer):
-        amount = serializers.DecimalField(required=False, max_digits=10, decimal_places=2)
-        description = serializers.CharField(required=False, allow_null=True, allow_blank=True)
         
-    class UpdateTransferOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        source_wallet = serializers.SerializerMethodField()
-        destination_wallet = serializers.SerializerMethodField()
-        amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
-        description = serializers.CharField(read_only=True)
-        date = serializers.DateField(read_only=True)
-        
-        def get_source_wallet(self, obj):
-            return {
-                'uid': obj.source_wallet.uid,
-                'title': obj.source_wallet.title
-            } if obj.source_wallet else None
-            
-        def get_destination_wallet(self, obj):
-            return {
-                'uid': obj.destination_wallet.uid,
-                'title': obj.destination_wallet.title
-            } if obj.destination_wallet else None
-    
-    @transaction.atomic
+        output_serializer = CreateTransferOutputSerializer(transfer)
+        response = _CREATE_TRANSFER_OK.copy()
+        response['data'] = output_serializer.to_representation(output_serializer.instance)
+        return json_response(response, status=status.HTTP_201_CREATED)
+
+class UpdateTransferAPIView(WalletBaseView):
+    @api_error_handler
     def patch(self, request, *args, **kwargs):
-        input_serializer = self.UpdateTransferInputSerializer(data=request.data)
+        input_serializer = UpdateTransferInputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         
-        try:
-            transfer = update_transfer(
-                transfer_uid=kwargs.get('transfer_uid'),
-                **input_serializer.validated_data,
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        output_serializer = self.UpdateTransferOutputSerializer(transfer)
-        return Response(
-            {
-                'success': True,
-                'message': 'Transfer updated successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_200_OK
+        validated_data = input_serializer.validated_data
+        transfer = update_transfer(
+            transfer_uid=kwargs.get('transfer_uid'),
+            amount=validated_data.get('amount'),
+            description=validated_data.get('description'),
+            user=request.user
         )
-
-class FetchTransferListAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-    
-    class FetchTransferListOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        source_wallet = serializers.SerializerMethodField()
-        destination_wallet = serializers.SerializerMethodField()
-        amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
-        description = serializers.CharField(read_only=True)
-        date = serializers.DateField(read_only=True)
-        created_at = serializers.DateTimeField(read_only=True)
         
-        def get_source_wallet(self, obj):
-            return {
-                'uid': obj.source_wallet.uid,
-                'title': obj.source_wallet.title
-            } if obj.source_wallet else None
-            
-        def get_destination_wallet(self, obj):
-            return {
-                'uid': obj.destination_wallet.uid,
-                'title': obj.destination_wallet.title
-            } if obj.destination_wallet else None
+        output_serializer = UpdateTransferOutputSerializer(transfer)
+        response = _UPDATE_TRANSFER_OK.copy()
+        response['data'] = output_serializer.to_representation(output_serializer.instance)
+        return json_response(response, status=status.HTTP_200_OK)
+
+class FetchTransferListAPIView(WalletBaseView):
+    renderer_classes = [ORJSONRenderer]
     
+    @method_decorator(condition(etag_func=_transfer_list_etag))
+    @api_error_handler
     def get(self, request, *args, **kwargs):
-        try:
-            transfers = get_transfer_list(user=request.user)
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-        output_serializer = self.FetchTransferListOutputSerializer(transfers, many=True)
-        return Response(
-            {
-                'success': True,
-                'message': 'Transfers fetched successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_200_OK
-        )
+        transfers = get_transfer_list(user=request.user)
+        paginator = DefaultPagination()
+        paginated_transfers = paginator.paginate_queryset(transfers, request, view=self)
 
-class FetchTransferDetailAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-    
-    class FetchTransferDetailOutputSerializer(serializers.Serializer):
-        uid = serializers.UUIDField(read_only=True)
-        source_wallet = serializers.SerializerMethodField()
-        destination_wallet = serializers.SerializerMethodField()
-        amount = serializers.DecimalField(read_only=True, max_digits=10, decimal_places=2)
-        description = serializers.CharField(read_only=True)
-        date = serializers.DateField(read_only=True)
-        created_at = serializers.DateTimeField(read_only=True)
-        
-        def get_source_wallet(self, obj):
-            return {
-                'uid': obj.source_wallet.uid,
-                'title': obj.source_wallet.title
-            } if obj.source_wallet else None
-            
-        def get_destination_wallet(self, obj):
-            return {
-                'uid': obj.destination_wallet.uid,
-                'title': obj.destination_wallet.title
-            } if obj.destination_wallet else None
+        output_serializer = FetchTransferListOutputSerializer(paginated_transfers, many=True)
+        response = _FETCH_TRANSFER_LIST_OK.copy()
+        response['count'] = paginator.page.paginator.count
+        response['next'] = paginator.get_next_link()
+        response['previous'] = paginator.get_previous_link()
+        response['data'] = output_serializer.to_representation(output_serializer.instance)
+        return Response(response, status=status.HTTP_200_OK)
+
+class FetchTransferDetailAPIView(WalletBaseView):
+    renderer_classes = [ORJSONRenderer]
     
+    @api_error_handler
     def get(self, request, *args, **kwargs):
-        try:
-            transfer = get_transfer_detail(
-                transfer_uid=kwargs.get('transfer_uid'),
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-        output_serializer = self.FetchTransferDetailOutputSerializer(transfer)
-        return Response(
-            {
-                'success': True,
-                'message': 'Transfer details fetched successfully.',
-                'data': output_serializer.data
-            },
-            status=status.HTTP_200_OK
+        transfer = get_transfer_detail(
+            transfer_uid=kwargs.get('transfer_uid'),
+            user=request.user
         )
+        if transfer is None:
+            raise DRFValidationError(detail="Transfer not found.")
+            
+        output_serializer = FetchTransferDetailOutputSerializer(transfer)
+        response = _FETCH_TRANSFER_DETAIL_OK.copy()
+        response['data'] = output_serializer.to_representation(output_serializer.instance)
+        return Response(response, status=status.HTTP_200_OK)
 
-class DeleteTransferAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-    
-    @transaction.atomic
+class DeleteTransferAPIView(WalletBaseView):
+    @api_error_handler
     def delete(self, request, *args, **kwargs):
-        try:
-            delete_transfer(
-                transfer_uid=kwargs.get('transfer_uid'),
-                user=request.user
-            )
-        except DjangoValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.message
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except DRFValidationError as e:
-            return Response(
-                {
-                    'success': False,
-                    'message': e.detail
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        delete_transfer(
+            transfer_uid=kwargs.get('transfer_uid'),
+            user=request.user
+        )
             
-        return Response(
-            {
-                'success': True,
-                'message': 'Transfer deleted successfully.'
-            },
-            status=status.HTTP_200_OK
-        )
\ No newline at end of file
+        return json_response(_DELETE_TRANSFER_OK, status=status.HTTP_200_OK)
\ No newline at end of file